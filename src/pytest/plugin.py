@@ -21,6 +21,7 @@ from xonsh.completer import Completer
 from xonsh.events import events
 from xonsh.execer import Execer
 from xonsh.jobs import get_tasks
+from xonsh.lexer import Lexer
 from xonsh.main import setup
 from xonsh.parsers.completion_context import CompletionContextParser
 
@@ -199,6 +200,15 @@ def session_execer():
     return Execer()
 
 
+@pytest.fixture(scope="session")
+def lexer():
+    """A built Lexer shared across the session, for tokenizing helpers
+    like ``subproc_toks`` without paying ``Lexer.build`` per test module."""
+    lx = Lexer()
+    lx.build()
+    return lx
+
+
 @pytest.fixture
 def os_env(session_os_env):
     """A mutable copy of Original session_os_env"""
@@ -808,10 +808,8 @@ def _yield_accessible_unix_file_names(path):
 
 
 def _executables_in_posix(path):
-    if not os.path.exists(path):
-        return
-    else:
-        yield from _yield_accessible_unix_file_names(path)
+    # existence is checked once in _yield_accessible_unix_file_names
+    yield from _yield_accessible_unix_file_names(path)
 
 
 def _executables_in_windows(path):
@@ -821,15 +819,12 @@ def _executables_in_windows(path):
     try:
         for x in os.scandir(path):
             try:
-                is_file = x.is_file()
+                if not x.is_file():
+                    continue
             except OSError:
                 continue
-            if is_file:
-                fname = x.name
-            else:
-                continue
-            base_name, ext = os.path.splitext(fname)
-            if ext.upper() in extensions:
+            fname = x.name
+            if os.path.splitext(fname)[1].upper() in extensions:
                 yield fname
     except FileNotFoundError:
         # On Windows, there's no guarantee for the directory to really
@@ -2403,35 +2398,26 @@ def check_for_partial_string(x):
     """
     string_indices = []
     starting_quote = []
-    current_index = 0
-    match = re.search(RE_BEGIN_STRING, x)
+    lenx = len(x)
+    match = RE_BEGIN_STRING.search(x)
     while match is not None:
-        # add the start in
-        start = match.start()
-        quote = match.group(0)
-        lenquote = len(quote)
-        current_index += start
         # store the starting index of the string, as well as the
         # characters in the starting quotes (e.g., ", ', """, r", etc)
-        string_indices.append(current_index)
+        quote, ender = match.group(0, 2)
+        string_indices.append(match.start())
         starting_quote.append(quote)
-        # determine the string that should terminate this string
-        ender = re.sub(RE_STRING_START, "", quote)
-        x = x[start + lenquote :]
-        current_index += lenquote
-        # figure out what is inside the string
-        continuer = RE_STRING_CONT[ender]
-        contents = re.match(continuer, x)
-        inside = contents.group(0)
-        leninside = len(inside)
-        current_index += contents.start() + leninside + len(ender)
+        # the string that should terminate this string is the bare quote
+        # captured by RE_BEGIN_STRING, so no need to strip the prefix again
+        # figure out what is inside the string, scanning in place rather
+        # than re-slicing the remaining input for every string found
+        contents = RE_STRING_CONT[ender].match(x, match.end())
+        endix = contents.end()
         # if we are not at the end of the input string, add the ending index of
         # the string to string_indices
-        if contents.end() < len(x):
-            string_indices.append(current_index)
-        x = x[leninside + len(ender) :]
+        if endix < lenx:
+            string_indices.append(endix + len(ender))
         # find the next match
-        match = re.search(RE_BEGIN_STRING, x)
+        match = RE_BEGIN_STRING.search(x, endix + len(ender))
     numquotes = len(string_indices)
     if numquotes == 0:
         return (None, None, None)